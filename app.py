@@ -1,18 +1,29 @@
 import streamlit as st
 import json
+import pandas as pd
 import firebase_admin
 from firebase_admin import credentials, firestore
 
-# Initialize Firebase only if it hasn't been initialized
-if not firebase_admin._apps:
-    cred = credentials.Certificate(json.loads(st.secrets["firebase_key"]))
-    firebase_admin.initialize_app(cred)
+# Initialize Firebase once per process instead of re-checking on every rerun
+@st.cache_resource
+def get_db():
+    """
+    Initializes Firebase and returns a Firestore client.
+
+    Returns:
+        google.cloud.firestore.Client: The shared Firestore client.
+    """
+    # Guard against an app left over from a previous cache entry
+    if not firebase_admin._apps:
+        cred = credentials.Certificate(json.loads(st.secrets["firebase_key"]))
+        firebase_admin.initialize_app(cred)
+    return firestore.client()
 
 # Get a reference to the Firestore database
-db = firestore.client()
+db = get_db()
 
-# Use @st.cache_data for functions that return data frames
-@st.cache_data
+# Use @st.cache_resource so reruns share the loaded data instead of unpickling a copy
+@st.cache_resource
 def load_data(collection_name):
     """
     Loads all documents from a specified Firestore collection.
@@ -21,13 +32,14 @@ def load_data(collection_name):
         collection_name (str): The name of the collection to load.
         
     Returns:
-        list: A list of dictionaries, where each dictionary represents a document.
+        pd.DataFrame: One row per document, one column per field.
+                      The frame is shared across reruns and sessions; do not mutate it.
     """
     st.write(f"Loading data from Firestore collection: {collection_name}")
     
     collection_ref = db.collection(collection_name)
     docs = collection_ref.stream()
-    data = [doc.to_dict() for doc in docs]
+    data = pd.DataFrame.from_records([doc.to_dict() for doc in docs])
     return data
 
 # Main Streamlit app
@@ -38,10 +50,12 @@ def main():
     collection_name = st.text_input("Enter Firestore collection name:", "your_collection_name")
 
     if collection_name:
-        # Optional: Add a dummy document for testing
-        dummy_collection = db.collection(collection_name)
-        dummy_data = {"name": "Test User", "score": 100, "date": firestore.SERVER_TIMESTAMP}
-        dummy_collection.add(dummy_data)
+        # Optional: Add a dummy document for testing, only when asked
+        if st.button("Seed sample data"):
+            dummy_collection = db.collection(collection_name)
+            dummy_data = {"name": "Test User", "score": 100, "date": firestore.SERVER_TIMESTAMP}
+            dummy_collection.add(dummy_data)
+            load_data.clear(collection_name)
 
         try:
             data = load_data(collection_name)
@@ -7,6 +7,13 @@ client = MongoClient("mongodb://localhost:27017/")
 db = client["oantracker"]
 collection = db["expense"]
 
+# 📅 Parse ISO strings on the C fast path, falling back to dateutil for anything else
+def parse_date(value):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
 # 🧼 Define ghost date threshold
 ghost_date = datetime(1970, 1, 2)
 
@@ -28,16 +35,18 @@ print(f"Deleted {result_ghost.deleted_count} documents with ghost dates before {
 
 # 🗑️ 3. Remove ghost documents with string-based dates
 string_ghosts = []
-for doc in collection.find({"date": {"$type": "string"}}):
+for doc in collection.find({"date": {"$type": "string"}}, {"date": 1}):
     try:
-        parsed = parser.parse(doc["date"])
+        parsed = parse_date(doc["date"])
         if parsed < ghost_date:
             string_ghosts.append(doc["_id"])
-            print("Ghost (string) found:", doc)
     except Exception as e:
         print("Unparsable date:", doc["date"])
 
 if string_ghosts:
+    # Preview the full documents before deleting them
+    for ghost in collection.find({"_id": {"$in": string_ghosts}}):
+        print("Ghost (string) found:", ghost)
     result_string_ghost = collection.delete_many({"_id": {"$in": string_ghosts}})
     print(f"Deleted {result_string_ghost.deleted_count} string-based ghost documents.")
 else: